@@ -8,12 +8,16 @@ This module exposes a small, focused API for removing:
 - Docstrings at module, class, and (async) function scope
 
 Implementation details:
-- Docstrings are removed by transforming the AST and deleting leading string-literal
-  expression statements from module/class/function bodies.
-- All comments (including inline and block comments) are removed via `ast.unparse`,
-  which regenerates code solely from the abstract syntax tree and drops comments.
-- Formatting, quotes, and minor layout details may change because the code is unparsed
-  from the AST. Semantics are preserved while comments and docstrings are removed.
+- By default a single pass over `tokenize` output drops every `COMMENT` token and every
+  string-literal statement in docstring position, leaving all other source text (and
+  therefore formatting) untouched. The input is still parsed once so invalid code
+  raises `SyntaxError`.
+- In strict mode, the code is regenerated from the AST by an `ast.unparse` variant that
+  skips module/class/function docstrings while emitting, so comments (which are not
+  part of the AST) and docstrings are dropped in a single traversal. Formatting,
+  quotes, and minor layout details may change because the code is unparsed.
+- Stripped outputs are cached on disk (see `shushpy._cache`), keyed by a hash of the
+  source, so unchanged files are not re-parsed across runs.
 
 This library has no third-party dependencies and integrates cleanly with uv or any
 PEP 517/518-compliant package manager.
@@ -22,11 +26,25 @@ PEP 517/518-compliant package manager.
 from __future__ import annotations
 
 import ast
+import contextlib
+import functools
+import io
+import itertools
 import logging
+import multiprocessing
+import os
+import re
+import tokenize
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Final
+from typing import Final, NamedTuple
+
+from shushpy import _cache
 
 __all__: Final[list[str]] = [
+    "iter_strip_paths",
     "strip_comments",
     "strip_file",
     "strip_path",
@@ -34,6 +52,15 @@ __all__: Final[list[str]] = [
 ]
 
 logger: logging.Logger = logging.getLogger(__name__)
+MEMO_MAXSIZE: Final[int] = 256
+CHUNKS_PER_WORKER: Final[int] = 4
+PROGRESS_LOG_INTERVAL: Final[int] = 500
+PREFETCH_DEPTH: Final[int] = 4
+# Forking a multi-threaded process (the caller's, or this module's prefetch threads)
+# can deadlock the child, so workers are started from a clean server process.
+WORKER_START_METHOD: Final[str] = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
 PYTHON_SUFFIX: Final[str] = ".py"
 IGNORED_DIR_NAMES: Final[set[str]] = {
     # Python packaging / environments
@@ -60,68 +87,103 @@ IGNORED_DIR_NAMES: Final[set[str]] = {
 }
 
 
-class DocstringStripper(ast.NodeTransformer):
-    """AST transformer that removes docstrings from modules, classes, and functions.
+def strip_comments(source: str, *, strict: bool = False) -> str:
+    """Strip all comments and docstrings from a Python source string.
+
+    This function:
+    - Removes module/class/function docstrings
+    - Eliminates all comments (inline and block)
+
+    By default a single pass over the token stream drops comments and docstrings and
+    keeps the remaining source text verbatim. With `strict=True` the code is instead
+    regenerated from the AST via `ast.unparse`, which normalizes formatting.
 
-    Docstrings are represented as a leading `ast.Expr` node whose value is a simple
-    string literal (i.e., `ast.Constant` with `str` value) for each body.
+    Args:
+        source: Python source code to transform.
+        strict: If True, use the AST round-trip instead of the tokenizer pass.
+
+    Returns:
+        The transformed source code with comments and docstrings removed.
 
-    Methods:
-        visit_Module: Remove module-level docstring if present.
-        visit_ClassDef: Remove class-level docstring if present, then visit children.
-        visit_FunctionDef: Remove function-level docstring if present, then visit children.
-        visit_AsyncFunctionDef: Remove async function-level docstring if present, then visit children.
+    Raises:
+        SyntaxError: If the input source is not syntactically valid Python.
+        ValueError: If `source` is empty or whitespace only.
     """
+    # Without `#` or any quote character there is no comment and no string literal,
+    # hence no docstring: the source is already stripped. It is still parsed so that
+    # invalid code raises SyntaxError. (`strip_file` goes through the cache instead,
+    # so that its index can serve such files without reading them.)
+    if (
+        not strict
+        and "#" not in source
+        and "'" not in source
+        and '"' not in source
+        and source.strip()
+    ):
+        ast.parse(source)
+        return source if source.endswith(_LINE_BREAKS) else f"{source}\n"
+
+    return _strip_memoized(source, strict)
+
+
+@functools.lru_cache(maxsize=MEMO_MAXSIZE)
+def _strip_memoized(source: str, strict: bool) -> str:
+    """Strip a source string passed to `strip_comments`, memoized in-process.
+
+    Repeated calls with the same string are served without re-stripping. The memoized
+    value is the immutable output string, so no AST is ever shared between calls.
+    Ad-hoc strings are never written to the on-disk cache, which is reserved for files.
+    File-based stripping bypasses this memo: it would pin every file's source in
+    memory, and the on-disk cache already serves repeated files.
 
-    @staticmethod
-    def _strip_docstring_from_body(body: list[ast.stmt]) -> list[ast.stmt]:
-        """Return a new body with a leading docstring removed, if present.
+    Args:
+        source: Python source code to transform.
+        strict: If True, use the AST round-trip instead of the tokenizer pass.
 
-        Args:
-            body: The list of statements for a node's body.
+    Returns:
+        The transformed source code with comments and docstrings removed.
 
-        Returns:
-            A list of statements without a leading docstring expression.
-        """
-        if not body:
-            return body
+    Raises:
+        SyntaxError: If the input source is not syntactically valid Python.
+        ValueError: If `source` is empty or whitespace only.
+    """
+    return _strip_source(source, strict, key=None)
 
-        first: ast.stmt = body[0]
-        if isinstance(first, ast.Expr):
-            value: ast.expr = first.value
-            # In Python 3.12+, docstrings are represented as Constant(str).
-            if isinstance(value, ast.Constant) and isinstance(value.value, str):
-                return body[1:]
 
-        return body
+def _strip_source(source: str, strict: bool, *, key: str | None) -> str:
+    """Strip a source string, consulting the on-disk cache first if `key` is given.
 
-    def visit_Module(self, node: ast.Module) -> ast.AST:  # noqa: N802 (AST API)
-        node.body = self._strip_docstring_from_body(node.body)
-        self.generic_visit(node)
-        return node
+    Args:
+        source: Python source code to transform.
+        strict: If True, use the AST round-trip instead of the tokenizer pass.
+        key: Cache key of `source` as returned by `_cache.source_key`, or None to
+            neither read nor write the on-disk cache.
 
-    def visit_ClassDef(self, node: ast.ClassDef) -> ast.AST:  # noqa: N802 (AST API)
-        node.body = self._strip_docstring_from_body(node.body)
-        self.generic_visit(node)
-        return node
+    Returns:
+        The transformed source code with comments and docstrings removed.
 
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> ast.AST:  # noqa: N802 (AST API)
-        node.body = self._strip_docstring_from_body(node.body)
-        self.generic_visit(node)
-        return node
+    Raises:
+        SyntaxError: If the input source is not syntactically valid Python.
+        ValueError: If `source` is empty or whitespace only.
+    """
+    if source.strip() == "":
+        raise ValueError("source must not be empty or whitespace only")
 
-    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> ast.AST:  # noqa: N802 (AST API)
-        node.body = self._strip_docstring_from_body(node.body)
-        self.generic_visit(node)
-        return node
+    if key is not None:
+        cached: str | None = _cache.load(key, strict=strict)
+        if cached is not None:
+            return cached
 
+    transformed: str = (
+        _strip_via_ast(source) if strict else _strip_via_tokenize(source)
+    )
+    if key is not None:
+        _cache.store(key, transformed, strict=strict)
+    return transformed
 
-def strip_comments(source: str) -> str:
-    """Strip all comments and docstrings from a Python source string.
 
-    This function:
-    - Removes module/class/function docstrings
-    - Eliminates all comments (inline and block) by unparsing from the AST
+def _strip_via_ast(source: str) -> str:
+    """Parse a non-blank source string and unparse it without docstrings.
 
     Args:
         source: Python source code to transform.
@@ -131,24 +193,320 @@ def strip_comments(source: str) -> str:
 
     Raises:
         SyntaxError: If the input source is not syntactically valid Python.
-        ValueError: If `source` is empty or whitespace only.
     """
-    if source.strip() == "":
-        raise ValueError("source must not be empty or whitespace only")
-
-    # Parse, strip docstrings, and unparse to drop all comments.
-    tree: ast.AST = ast.parse(source)
-    stripper: DocstringStripper = DocstringStripper()
-    new_tree: ast.AST = stripper.visit(tree)
-    ast.fix_missing_locations(new_tree)
+    # Imported lazily: it builds on the private `ast._Unparser`, which only strict mode
+    # needs, so the default token mode keeps working without it.
+    from shushpy._unparse import FusedUnparser
 
-    transformed: str = ast.unparse(new_tree)
+    # Unparsing drops all comments; docstrings are skipped in the same traversal.
+    transformed: str = FusedUnparser().visit(ast.parse(source))
     # Ensure a trailing newline for POSIX-friendly formatting.
     if not transformed.endswith("\n"):
         transformed = f"{transformed}\n"
     return transformed
 
 
+# Any of these ends a line for the parser; a source already ending in one needs no
+# extra newline appended.
+_LINE_BREAKS: Final[tuple[str, str]] = ("\n", "\r")
+_CODE_SPECIAL: Final[re.Pattern[bytes]] = re.compile(rb"[#'\"]")
+_INLINE_WHITESPACE: Final[bytes] = b" \t\x0c"
+_LINE_BREAK: Final[re.Pattern[bytes]] = re.compile(rb"\r\n?|\n")
+# Tokens that may sit between the parts of a statement without ending it.
+_SKIPPABLE_TOKENS: Final[frozenset[int]] = frozenset({tokenize.COMMENT, tokenize.NL})
+
+
+def _strip_ascii_comments(data: bytes) -> bytes | None:
+    """Remove `#` comments from ASCII Python source that has no string literals.
+
+    The scanner jumps between `#` and quote characters with a compiled regular
+    expression, so only those bytes are inspected in Python. Quotes inside comments are
+    skipped with the comment. A quote outside a comment starts a string literal, which
+    may be a docstring or hide a `#`, so the scan gives up and returns None. The output
+    matches the comment handling of the token pass: whitespace before a comment goes
+    with it, and lines left blank are dropped. Like the parser, `\n`, `\r\n`, and a bare
+    `\r` all end a line, and the original line breaks are kept.
+
+    Args:
+        data: Syntactically valid, ASCII-encoded Python source.
+
+    Returns:
+        The source with every comment removed, or None if it contains a string literal.
+    """
+    pieces: list[bytes] = []
+    emitted: int = 0  # start of the not-yet-copied remainder
+    index: int = 0
+    size: int = len(data)
+    while (match := _CODE_SPECIAL.search(data, index)) is not None:
+        start: int = match.start()
+        if data[start] != ord("#"):
+            return None
+
+        line_start: int = (
+            max(data.rfind(b"\n", 0, start), data.rfind(b"\r", 0, start)) + 1
+        )
+        line_break: re.Match[bytes] | None = _LINE_BREAK.search(data, start)
+        line_end: int = size if line_break is None else line_break.start()
+        cut: int = start
+        while cut > line_start and data[cut - 1] in _INLINE_WHITESPACE:
+            cut -= 1
+        if cut == line_start:
+            # Comment-only line: drop it together with its line break.
+            pieces.append(data[emitted:line_start])
+            emitted = size if line_break is None else line_break.end()
+        else:
+            pieces.append(data[emitted:cut])
+            emitted = line_end
+        index = line_end
+
+    pieces.append(data[emitted:])
+    return b"".join(pieces)
+
+
+def _is_docstring_token(token: tokenize.TokenInfo) -> bool:
+    """Return True if a STRING token is a str (not bytes) literal."""
+    prefix: str = token.string[: len(token.string) - len(token.string.lstrip("rRuUbB"))]
+    return "b" not in prefix.lower()
+
+
+_DOCSTRING_SCOPES: Final[
+    tuple[
+        type[ast.Module],
+        type[ast.ClassDef],
+        type[ast.FunctionDef],
+        type[ast.AsyncFunctionDef],
+    ]
+] = (
+    ast.Module,
+    ast.ClassDef,
+    ast.FunctionDef,
+    ast.AsyncFunctionDef,
+)
+
+
+def _has_docstring(tree: ast.Module) -> bool:
+    """Return True if any module, class, or function in `tree` has a docstring.
+
+    Walking the already-parsed tree is much cheaper than tokenizing the source, so
+    this check lets the token pass be skipped whenever it would change nothing.
+
+    Args:
+        tree: Parsed module to inspect.
+
+    Returns:
+        True if some scope starts with a string-literal statement.
+    """
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, _DOCSTRING_SCOPES)
+            and ast.get_docstring(node, clean=False) is not None
+        ):
+            return True
+    return False
+
+
+def _docstring_literal_end(tokens: list[tokenize.TokenInfo], start: int) -> int:
+    """Return the index just past a str literal expression starting at `start`.
+
+    The literal is one or more (implicitly concatenated) STRING tokens, optionally
+    wrapped in any number of balanced parentheses, inside which line breaks and
+    comments may appear: `"doc"`, `("doc")`, or `("a"\n "b")` all qualify, exactly
+    like the expressions `ast` reports as docstrings.
+
+    Args:
+        tokens: Token stream of the whole source, ending with `ENDMARKER`.
+        start: Index of the first token of the candidate statement.
+
+    Returns:
+        The index after the last token of the literal, or 0 if the statement does not
+        start with a str literal expression.
+    """
+    index: int = start
+    opened: int = 0
+    while tokens[index].type == tokenize.OP and tokens[index].string == "(":
+        opened += 1
+        index += 1
+        while tokens[index].type in _SKIPPABLE_TOKENS:
+            index += 1
+
+    if tokens[index].type != tokenize.STRING or not _is_docstring_token(tokens[index]):
+        return 0
+    while tokens[index].type == tokenize.STRING:
+        index += 1
+        while opened and tokens[index].type in _SKIPPABLE_TOKENS:
+            index += 1
+
+    while opened:
+        if tokens[index].type != tokenize.OP or tokens[index].string != ")":
+            return 0
+        opened -= 1
+        index += 1
+        while opened and tokens[index].type in _SKIPPABLE_TOKENS:
+            index += 1
+    return index
+
+
+def _strip_via_tokenize(source: str) -> str:
+    """Drop comments and docstrings from a non-blank source string in one token pass.
+
+    `COMMENT` tokens are cut from their line (lines left blank are removed). A
+    docstring is a string-literal statement in docstring position: at module start or
+    first in a `def`/`class` body. A docstring occupying its own lines is deleted; one
+    sharing its line with a header or with `;` is replaced by `pass`, as is one that is
+    the only statement of a class/function body. At module level a docstring followed
+    by `;` is removed together with the `;` instead, because a leading `pass` would
+    break `from __future__` imports. All other text is kept verbatim.
+
+    Args:
+        source: Python source code to transform.
+
+    Returns:
+        The transformed source code with comments and docstrings removed.
+
+    Raises:
+        SyntaxError: If the input source is not syntactically valid Python.
+    """
+    # The tokenizer accepts many invalid programs; parse once to keep the contract
+    # that invalid input raises SyntaxError.
+    tree: ast.Module = ast.parse(source)
+
+    # Without `#` there is no comment, so a tree without docstrings (typical of
+    # `__init__.py` re-exports and version stubs) means nothing is left to strip.
+    if "#" not in source and not _has_docstring(tree):
+        return source if source.endswith(_LINE_BREAKS) else f"{source}\n"
+
+    # Pure-ASCII source without string literals can have its comments removed by a
+    # byte scanner; with no string there is no docstring, so tokenizing is skipped.
+    if source.isascii():
+        scanned: bytes | None = _strip_ascii_comments(source.encode("ascii"))
+        if scanned is not None:
+            residue: str = scanned.decode("ascii")
+            return residue if residue.endswith(_LINE_BREAKS) else f"{residue}\n"
+
+    # `newline=""` splits on `\n`, `\r\n`, and a bare `\r` (like the parser does)
+    # without translating, so rows match the tokenizer's and line endings survive.
+    lines: list[str] = io.StringIO(source, newline="").readlines()
+    tokens: list[tokenize.TokenInfo] = list(
+        tokenize.generate_tokens(io.StringIO(source, newline="").readline)
+    )
+
+    # row -> (column, inside an f-string replacement field) of each comment.
+    comments: dict[int, tuple[int, bool]] = {}
+    # (start, end, replacement) spans of docstring statements; a None replacement
+    # deletes the lines the docstring occupies.
+    docstrings: list[tuple[tuple[int, int], tuple[int, int], str | None]] = []
+
+    candidate: bool = True  # next statement is in docstring position
+    in_module: bool = True  # the candidate scope is the module
+    inline: bool = False  # the candidate follows a header colon on the same line
+    line_start: bool = True  # next significant token starts a logical line
+    in_header: bool = False  # between `def`/`class` and its colon
+    after_colon: bool = False  # just consumed a header colon
+    depth: int = 0
+    fstring_depth: int = 0
+
+    count: int = len(tokens)
+    index: int = 0
+    while index < count:
+        token: tokenize.TokenInfo = tokens[index]
+        kind: int = token.type
+        index += 1
+
+        if kind == tokenize.COMMENT:
+            comments[token.start[0]] = (token.start[1], fstring_depth > 0)
+            continue
+        if kind == tokenize.FSTRING_START:
+            fstring_depth += 1
+        elif kind == tokenize.FSTRING_END:
+            fstring_depth -= 1
+        if kind in (tokenize.NL, tokenize.INDENT, tokenize.DEDENT):
+            continue
+        if kind == tokenize.NEWLINE:
+            line_start = True
+            if after_colon:
+                after_colon = False
+                candidate, in_module, inline = True, False, False
+            continue
+
+        if after_colon:
+            after_colon = False
+            candidate, in_module, inline = True, False, True
+
+        if candidate:
+            candidate = False
+            end: int = _docstring_literal_end(tokens, index - 1)
+            if end:
+                follow: int = end
+                while follow < count and tokens[follow].type in _SKIPPABLE_TOKENS:
+                    follow += 1
+                closer: tokenize.TokenInfo = tokens[follow]
+                if closer.type == tokenize.NEWLINE or (
+                    closer.type == tokenize.OP and closer.string == ";"
+                ):
+                    span_end: tuple[int, int] = tokens[end - 1].end
+                    replacement: str | None = None
+                    if in_module and closer.type == tokenize.OP:
+                        # Splice out the docstring and its `;`, keep the rest.
+                        span_end, replacement = closer.end, ""
+                    elif inline or closer.type == tokenize.OP:
+                        replacement = "pass"
+                    elif not in_module:
+                        follow += 1
+                        while (
+                            follow < count
+                            and tokens[follow].type in _SKIPPABLE_TOKENS
+                        ):
+                            follow += 1
+                        if tokens[follow].type == tokenize.DEDENT:
+                            replacement = "pass"
+                    docstrings.append((token.start, span_end, replacement))
+                    index = end
+                    line_start = False
+                    continue
+
+        if kind == tokenize.NAME and line_start and token.string in ("def", "class"):
+            in_header = True
+        elif kind == tokenize.OP and in_header:
+            if token.string in "([{":
+                depth += 1
+            elif token.string in ")]}":
+                depth -= 1
+            elif token.string == ":" and depth == 0:
+                in_header = False
+                after_colon = True
+        # `async def` keeps the logical line open for the `def` keyword.
+        line_start = line_start and kind == tokenize.NAME and token.string == "async"
+
+    for row, (col, in_fstring) in comments.items():
+        line: str = lines[row - 1]
+        ending: str = line[len(line.rstrip("\r\n")) :]
+        if in_fstring:
+            # Whitespace and line breaks inside a replacement field are significant
+            # for self-documenting expressions (`f"{x = }"`), so only the comment goes.
+            lines[row - 1] = f"{line[:col]}{ending}"
+            continue
+        kept: str = line[:col].rstrip()
+        lines[row - 1] = f"{kept}{ending}" if kept else ""
+
+    for (start_row, start_col), (end_row, end_col), replacement in docstrings:
+        if replacement is None:
+            lines[start_row - 1] = ""
+        else:
+            tail: str = lines[end_row - 1][end_col:]
+            if not replacement:
+                tail = tail.lstrip(" \t")
+            spliced: str = f"{lines[start_row - 1][:start_col]}{replacement}{tail}"
+            lines[start_row - 1] = spliced if spliced.strip() else ""
+        for row in range(start_row + 1, end_row + 1):
+            lines[row - 1] = ""
+
+    transformed: str = "".join(lines)
+    # Ensure a trailing newline for POSIX-friendly formatting.
+    if not transformed.endswith(_LINE_BREAKS):
+        transformed = f"{transformed}\n"
+    return transformed
+
+
 def _read_text(path: Path, encoding: str) -> str:
     """Read file content using the provided encoding.
 
@@ -163,9 +521,9 @@ def _read_text(path: Path, encoding: str) -> str:
         FileNotFoundError: If the file is not found.
         UnicodeDecodeError: If decoding fails.
     """
-    with path.open("r", encoding=encoding, newline="") as f:
-        data: str = f.read()
-    return data
+    # One bulk read and a single C-level decode; line endings are kept as-is, exactly
+    # like a text-mode read with `newline=""`.
+    return path.read_bytes().decode(encoding)
 
 
 def _write_text(path: Path, data: str, encoding: str) -> None:
@@ -182,8 +540,8 @@ def _write_text(path: Path, data: str, encoding: str) -> None:
     """
     # Create parent directory if missing to fail fast with clear intent.
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding=encoding, newline="\n") as f:
-        f.write(data)
+    # Encoding up front means an unencodable character no longer truncates the file.
+    path.write_bytes(data.encode(encoding))
 
 
 def strip_file(
@@ -191,6 +549,8 @@ def strip_file(
     *,
     inplace: bool = False,
     encoding: str = "utf-8",
+    strict: bool = False,
+    use_cache: bool = True,
 ) -> str:
     """Strip comments and docstrings from a single Python file.
 
@@ -198,6 +558,8 @@ def strip_file(
         path: Path to a `.py` file.
         inplace: If True, overwrite the file with the stripped content.
         encoding: File encoding used for reading and (optionally) writing.
+        strict: If True, regenerate code via the AST instead of the tokenizer pass.
+        use_cache: If False, neither read nor write the on-disk cache.
 
     Returns:
         The stripped source code.
@@ -210,6 +572,48 @@ def strip_file(
         OSError: For filesystem-related errors when writing inplace.
     """
     file_path: Path = Path(path)
+    return _finish_file(
+        file_path,
+        _load_file(file_path, encoding=encoding, strict=strict, use_cache=use_cache),
+        inplace=inplace,
+        encoding=encoding,
+        strict=strict,
+        use_cache=use_cache,
+    )
+
+
+class _LoadedFile(NamedTuple):
+    """Outcome of the I/O half of `strip_file`, handed to its compute half."""
+
+    stat: os.stat_result
+    key: str | None  # content key recorded in the index, if any
+    stripped: str | None  # cached stripped output, or None on a miss
+    original: str | None  # decoded file content, read only on a miss
+
+
+def _load_file(
+    file_path: Path, *, encoding: str, strict: bool, use_cache: bool
+) -> _LoadedFile:
+    """Do the I/O half of `strip_file`: validate, stat, and fetch the content.
+
+    An unchanged file (same mtime and size) maps straight to its cached output, so
+    the file itself is only read on a cache miss.
+
+    Args:
+        file_path: Path to a `.py` file.
+        encoding: File encoding used for reading.
+        strict: If True, look up the strict-mode cached output.
+        use_cache: If False, skip the index and always read the file.
+
+    Returns:
+        The file's stat result and content key, plus either its cached stripped
+        output or its decoded content.
+
+    Raises:
+        ValueError: If `file_path` does not point to a `.py` file.
+        FileNotFoundError: If `file_path` does not exist.
+        UnicodeDecodeError: If decoding fails.
+    """
     if not file_path.exists():
         raise FileNotFoundError(f"No such file: {file_path}")
     if not file_path.is_file():
@@ -221,25 +625,137 @@ def strip_file(
             f"Expected a Python file with '.py' suffix, got: {file_path.name}"
         )
 
-    original: str = _read_text(file_path, encoding=encoding)
-    if not original:
-        return original
+    stat: os.stat_result = file_path.stat()
+    key: str | None = (
+        _cache.lookup_index(file_path, stat, encoding) if use_cache else None
+    )
+    if key is not None:
+        cached: str | None = _cache.load(key, strict=strict)
+        if cached is not None:
+            return _LoadedFile(stat, key, cached, None)
+    return _LoadedFile(stat, key, None, _read_text(file_path, encoding=encoding))
+
+
+def _finish_file(
+    file_path: Path,
+    loaded: _LoadedFile,
+    *,
+    inplace: bool,
+    encoding: str,
+    strict: bool,
+    use_cache: bool,
+) -> str:
+    """Do the compute half of `strip_file` on the result of `_load_file`.
+
+    See `strip_file` for the meaning of the arguments and the raised exceptions.
+    """
+    stat, key, stripped, original = loaded
+    if stripped is None:
+        if not original:
+            return ""
+
+        key = _cache.source_key(original)
+        stripped = _strip_source(original, strict, key=key if use_cache else None)
+        if use_cache:
+            _cache.record_index(file_path, stat, encoding, key)
 
-    stripped: str = strip_comments(original)
     if inplace:
-        _write_text(file_path, stripped, encoding=encoding)
+        # Rewriting a file that is already stripped would only bump its mtime and
+        # invalidate the index entry above, so identical content is left alone.
+        stripped_key: str = _cache.source_key(stripped)
+        if stripped_key != key:
+            _write_text(file_path, stripped, encoding=encoding)
+            if use_cache:
+                _cache.record_index(
+                    file_path, file_path.stat(), encoding, stripped_key
+                )
     return stripped
 
 
-def _iter_python_files(root: Path, recursive: bool) -> list[Path]:
-    """Collect Python files under a path.
+def _prefetch(
+    files: Iterable[Path],
+    load: Callable[[Path], _LoadedFile],
+) -> Generator[tuple[Path, Future[_LoadedFile]], None, None]:
+    """Yield each file with a future of `load(file)`, loading ahead on threads.
+
+    Up to `PREFETCH_DEPTH` files beyond the one being consumed are loaded in the
+    background. File reads release the GIL, so disk latency overlaps with the
+    tokenizing and parsing done by the consumer. Futures are yielded in input order,
+    and an error raised by `files` itself surfaces only after the files before it.
+
+    Args:
+        files: Files to load.
+        load: Function performing the I/O for one file.
+
+    Yields:
+        `(file, future)` pairs; the future raises whatever `load` raised.
+    """
+    with ThreadPoolExecutor(max_workers=PREFETCH_DEPTH) as executor:
+        pending: deque[tuple[Path, Future[_LoadedFile]]] = deque()
+        try:
+            discovery_error: Exception | None = None
+            try:
+                for file_path in files:
+                    pending.append((file_path, executor.submit(load, file_path)))
+                    if len(pending) > PREFETCH_DEPTH:
+                        yield pending.popleft()
+            except Exception as exc:
+                # Discovery failed: hand out the files found before the failure first.
+                discovery_error = exc
+            while pending:
+                yield pending.popleft()
+            if discovery_error is not None:
+                raise discovery_error
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+
+
+def _scan_python_files(root: Path, recursive: bool) -> Iterator[Path]:
+    """Yield Python files in a directory using `os.scandir`.
+
+    `DirEntry` caches the file type reported by the directory listing, so no extra
+    `stat` call is needed per entry. Directories are walked iteratively, skipping
+    ignored names, Python packages (directories containing `__init__.py`), and
+    symlinked directories (which could otherwise form cycles).
+
+    Args:
+        root: Directory to scan.
+        recursive: If True, descend into subdirectories.
+
+    Yields:
+        Paths of Python files, wrapped as `Path` only at this boundary.
+    """
+    stack: list[str] = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if (
+                        recursive
+                        and entry.name not in IGNORED_DIR_NAMES
+                        and not os.path.exists(os.path.join(entry.path, "__init__.py"))
+                    ):
+                        stack.append(entry.path)
+                elif (
+                    os.path.splitext(entry.name)[1].lower() == PYTHON_SUFFIX
+                    and entry.is_file()
+                ):
+                    yield Path(entry.path)
+
+
+def _iter_python_files(root: Path, recursive: bool) -> Iterator[Path]:
+    """Lazily yield the Python files under a path.
+
+    Files are yielded while the tree is being scanned, so stripping can start before
+    discovery finishes and the full path list is never held in memory.
 
     Args:
         root: Root path (file or directory).
         recursive: If True and root is a directory, recurse into subdirectories.
 
-    Returns:
-        A list of Python file paths to process.
+    Yields:
+        Python file paths to process.
 
     Raises:
         ValueError: If `root` is neither a file nor a directory.
@@ -250,52 +766,166 @@ def _iter_python_files(root: Path, recursive: bool) -> list[Path]:
         return any(part in IGNORED_DIR_NAMES for part in p.parts)
 
     if root.is_file():
-        if root.suffix.lower() != PYTHON_SUFFIX:
-            return []
-        return [] if _is_ignored(root) else [root]
+        if root.suffix.lower() == PYTHON_SUFFIX and not _is_ignored(root):
+            yield root
+        return
 
     if root.is_dir():
-        if not recursive:
-            return [
-                p
-                for p in root.iterdir()
-                if p.is_file()
-                and p.suffix.lower() == PYTHON_SUFFIX
-                and not _is_ignored(p)
-            ]
-
-        # Recursive traversal that prunes ignored and Python package directories.
-        collected: list[Path] = []
-
-        def _walk_dir(d: Path) -> None:
-            if _is_ignored(d):
-                return
-            # Collect files in current directory
-            for child in d.iterdir():
-                if child.is_file():
-                    if child.suffix.lower() == PYTHON_SUFFIX and not _is_ignored(child):
-                        collected.append(child)
-                elif child.is_dir():
-                    # Skip ignored names
-                    if child.name in IGNORED_DIR_NAMES:
-                        continue
-                    # Skip Python packages (directories containing __init__.py)
-                    if (child / "__init__.py").exists():
-                        continue
-                    _walk_dir(child)
-
-        _walk_dir(root)
-        return collected
+        if not _is_ignored(root):
+            yield from _scan_python_files(root, recursive)
+        return
 
     raise ValueError(f"Path is neither a file nor a directory: {root}")
 
 
+def _resolve_jobs(jobs: int) -> int:
+    """Return the number of worker processes to use for `jobs`.
+
+    Args:
+        jobs: Requested worker count; values below 1 mean one per CPU.
+
+    Returns:
+        A positive worker count.
+    """
+    if jobs >= 1:
+        return jobs
+    return os.cpu_count() or 1
+
+
+def _log_progress(count: int) -> None:
+    """Log progress every `PROGRESS_LOG_INTERVAL` files."""
+    if count % PROGRESS_LOG_INTERVAL == 0:
+        logger.debug("Stripped %d file(s) so far", count)
+
+
+def _collect(file_path: Path, result: Callable[[], str]) -> str:
+    """Return the stripped content produced by `result`, logging failures.
+
+    Args:
+        file_path: The file being processed (for diagnostics).
+        result: Zero-argument callable producing the stripped content.
+
+    Returns:
+        The stripped source code.
+    """
+    try:
+        return result()
+    except SyntaxError:
+        # Re-raise SyntaxError as-is for transparency.
+        logger.exception("SyntaxError while stripping %s", file_path)
+        raise
+    except (UnicodeError, OSError) as exc:
+        logger.exception("I/O or encoding error while stripping %s", file_path)
+        raise exc
+
+
+def _iter_root_files(path: str | Path, recursive: bool) -> Iterator[Path]:
+    """Validate one path argument and lazily yield the Python files under it.
+
+    See `strip_path` for the meaning of the arguments and the raised exceptions.
+    """
+    root: Path = Path(path)
+    if not root.exists():
+        raise FileNotFoundError(f"No such path: {root}")
+
+    files: Iterator[Path] = _iter_python_files(root, recursive=recursive)
+    if root.is_file():
+        single: list[Path] = list(files)
+        if not single:
+            raise ValueError(
+                f"Expected a Python file with '.py' suffix, got: {root.name}"
+            )
+        files = iter(single)
+    yield from files
+
+
+def _iter_strip_files(
+    files: Iterator[Path],
+    *,
+    inplace: bool,
+    encoding: str,
+    jobs: int,
+    strict: bool,
+    use_cache: bool,
+) -> Iterator[tuple[str, str]]:
+    """Yield `(file path, stripped content)` pairs for the given files, in order.
+
+    See `strip_path` for the meaning of the arguments and the raised exceptions.
+    """
+    count: int = 0
+    workers: int = _resolve_jobs(jobs)
+    batch: list[Path] = []
+    if workers > 1:
+        # Sizing the worker pool and its chunks (and `Executor.map` itself) needs the
+        # full list across every path argument; only serial runs stream discovery.
+        batch = list(files)
+        workers = min(workers, len(batch))
+        files = iter(batch)
+
+    if workers <= 1:
+        # Discovery is streamed: files are stripped as the scan yields them, and
+        # reads are prefetched on threads while this thread strips the current file.
+        load_one: Callable[[Path], _LoadedFile] = functools.partial(
+            _load_file, encoding=encoding, strict=strict, use_cache=use_cache
+        )
+        finish_one: Callable[[Path, _LoadedFile], str] = functools.partial(
+            _finish_file,
+            inplace=inplace,
+            encoding=encoding,
+            strict=strict,
+            use_cache=use_cache,
+        )
+        # Closing the generator on any exit (an error, or the caller abandoning this
+        # iterator) cancels queued loads and joins the reader threads right away.
+        with contextlib.closing(_prefetch(files, load_one)) as prefetched:
+            for count, (file_path, loaded) in enumerate(prefetched, start=1):
+                yield str(file_path), _collect(
+                    file_path, lambda: finish_one(file_path, loaded.result())
+                )
+                _log_progress(count)
+        logger.debug("Stripped %d file(s)", count)
+        return
+
+    # Files are independent, so parse/unparse them on separate cores. Files are sent
+    # to workers in chunks to amortize inter-process overhead on trees of many small
+    # files. Results come back in input order, which surfaces the same first error as
+    # the serial loop.
+    strip_one: Callable[[Path], str] = functools.partial(
+        strip_file,
+        inplace=inplace,
+        encoding=encoding,
+        strict=strict,
+        use_cache=use_cache,
+    )
+    chunksize: int = max(1, len(batch) // (workers * CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context(WORKER_START_METHOD),
+        # A forkserver keeps the environment it started with; hand the current cache
+        # settings to each worker instead.
+        initializer=_cache.adopt_environment,
+        initargs=(_cache.environment(),),
+    ) as executor:
+        results: Iterator[str] = executor.map(strip_one, batch, chunksize=chunksize)
+        try:
+            for count, file_path in enumerate(batch, start=1):
+                yield str(file_path), _collect(file_path, results.__next__)
+                _log_progress(count)
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+    logger.debug("Stripped %d file(s)", count)
+
+
 def strip_path(
     path: str | Path,
     *,
     inplace: bool = False,
     encoding: str = "utf-8",
     recursive: bool = True,
+    jobs: int = 1,
+    strict: bool = False,
+    use_cache: bool = True,
 ) -> dict[str, str]:
     """Strip comments and docstrings from a path (file or directory).
 
@@ -307,6 +937,10 @@ def strip_path(
         inplace: If True, overwrite the processed files with stripped content.
         encoding: File encoding used for reading and (optionally) writing.
         recursive: If True and `path` is a directory, process files recursively.
+        jobs: Number of worker processes used to strip files in parallel. Values
+            below 1 use one worker per CPU; 1 (the default) processes files serially.
+        strict: If True, regenerate code via the AST instead of the tokenizer pass.
+        use_cache: If False, neither read nor write the on-disk cache.
 
     Returns:
         A mapping from file path (string) to the stripped source content.
@@ -319,28 +953,68 @@ def strip_path(
         ValueError: If `path` is neither a file nor a directory, or if a single file
             without `.py` suffix is provided.
     """
-    root: Path = Path(path)
-    if not root.exists():
-        raise FileNotFoundError(f"No such path: {root}")
+    return dict(
+        iter_strip_paths(
+            [path],
+            inplace=inplace,
+            encoding=encoding,
+            recursive=recursive,
+            jobs=jobs,
+            strict=strict,
+            use_cache=use_cache,
+        )
+    )
 
-    files: list[Path] = _iter_python_files(root, recursive=recursive)
-    if root.is_file() and not files:
-        raise ValueError(f"Expected a Python file with '.py' suffix, got: {root.name}")
 
-    results: dict[str, str] = {}
-    for file_path in files:
-        try:
-            transformed: str = strip_file(file_path, inplace=inplace, encoding=encoding)
-            results[str(file_path)] = transformed
-        except SyntaxError:
-            # Re-raise SyntaxError as-is for transparency.
-            logger.exception("SyntaxError while stripping %s", file_path)
-            raise
-        except (UnicodeError, OSError) as exc:
-            logger.exception("I/O or encoding error while stripping %s", file_path)
-            raise exc
+def iter_strip_paths(
+    paths: Iterable[str | Path],
+    *,
+    inplace: bool = False,
+    encoding: str = "utf-8",
+    recursive: bool = True,
+    jobs: int = 1,
+    strict: bool = False,
+    use_cache: bool = True,
+) -> Iterator[tuple[str, str]]:
+    """Lazily strip comments and docstrings from multiple paths.
+
+    Each `(file path, stripped content)` pair is yielded as soon as the file has been
+    processed, so callers that only rewrite files in place never hold more than one
+    result at a time. Errors are raised while iterating.
 
-    return results
+    Args:
+        paths: File or directory paths.
+        inplace: If True, overwrite the processed files with stripped content.
+        encoding: File encoding used for reading and (optionally) writing.
+        recursive: If True, recurse into subdirectories for any directory paths.
+        jobs: Number of worker processes used to strip files in parallel. Values
+            below 1 use one worker per CPU; 1 (the default) processes files serially.
+        strict: If True, regenerate code via the AST instead of the tokenizer pass.
+        use_cache: If False, neither read nor write the on-disk cache.
+
+    Yields:
+        Pairs of file path (string) and stripped source content.
+
+    Raises:
+        FileNotFoundError: If any path does not exist.
+        SyntaxError: If any processed file contains invalid Python code.
+        UnicodeError: If decoding or encoding fails for any file.
+        OSError: For filesystem-related errors when writing inplace.
+        ValueError: If any provided path is neither a file nor a directory.
+    """
+    # Files from every path argument form one stream, so a parallel run sizes a
+    # single worker pool and its chunks for the whole job.
+    files: Iterator[Path] = itertools.chain.from_iterable(
+        _iter_root_files(p, recursive) for p in paths
+    )
+    yield from _iter_strip_files(
+        files,
+        inplace=inplace,
+        encoding=encoding,
+        jobs=jobs,
+        strict=strict,
+        use_cache=use_cache,
+    )
 
 
 def strip_paths(
@@ -349,6 +1023,9 @@ def strip_paths(
     inplace: bool = False,
     encoding: str = "utf-8",
     recursive: bool = True,
+    jobs: int = 1,
+    strict: bool = False,
+    use_cache: bool = True,
 ) -> dict[str, str]:
     """Strip comments and docstrings from multiple paths (files and/or directories).
 
@@ -357,6 +1034,10 @@ def strip_paths(
         inplace: If True, overwrite the processed files with stripped content.
         encoding: File encoding used for reading and (optionally) writing.
         recursive: If True, recurse into subdirectories for any directory paths.
+        jobs: Number of worker processes used to strip files in parallel. Values
+            below 1 use one worker per CPU; 1 (the default) processes files serially.
+        strict: If True, regenerate code via the AST instead of the tokenizer pass.
+        use_cache: If False, neither read nor write the on-disk cache.
 
     Returns:
         A mapping from file path (string) to the stripped source content across all inputs.
@@ -368,10 +1049,14 @@ def strip_paths(
         OSError: For filesystem-related errors when writing inplace.
         ValueError: If any provided path is neither a file nor a directory.
     """
-    aggregated: dict[str, str] = {}
-    for p in paths:
-        result_for_path: dict[str, str] = strip_path(
-            p, inplace=inplace, encoding=encoding, recursive=recursive
+    return dict(
+        iter_strip_paths(
+            paths,
+            inplace=inplace,
+            encoding=encoding,
+            recursive=recursive,
+            jobs=jobs,
+            strict=strict,
+            use_cache=use_cache,
         )
-        aggregated.update(result_for_path)
-    return aggregated
+    )
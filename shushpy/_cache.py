@@ -0,0 +1,292 @@
+"""
+Persistent on-disk cache for stripped Python sources.
+
+Two kinds of entries live under the user cache directory:
+- Content entries, keyed by a BLAKE2b digest of the source text and stored per
+  stripping mode, that hold the stripped output. A hit bypasses tokenizing, parsing,
+  and unparsing entirely.
+- Index entries, keyed by a file's absolute path and encoding, that record the
+  file's stat signature (`st_mtime_ns`, `st_size`, `st_ino`, `st_ctime_ns`) together
+  with the content key of its source. A hit lets `strip_file` skip reading the file
+  altogether. As in git's index, an entry written no later than the file's mtime is
+  "racily clean" (the file may have changed again within the same timestamp tick)
+  and is ignored.
+
+The digest is personalized with the running Python version because `ast.unparse`
+output may differ between minor versions. Entries live under a directory named after
+`CACHE_FORMAT_VERSION` and the installed shushpy version, so upgrading shushpy never
+serves output produced by an older release. All writes are atomic (`os.replace`), and
+every filesystem error (or an unresolvable home directory) is swallowed: the cache is
+an optimization, never a requirement. Setting `SHUSHPY_NO_CACHE` to a non-empty value
+disables it entirely. Only files are cached; strings passed to `strip_comments` are
+memoized in-process instead. Caches of other releases left unused for
+`RELEASE_MAX_AGE_SECONDS` are deleted.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from importlib import metadata
+from pathlib import Path
+from typing import Final
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV: Final[str] = "SHUSHPY_CACHE_DIR"
+NO_CACHE_ENV: Final[str] = "SHUSHPY_NO_CACHE"
+# Bump whenever the stripped output for an unchanged source changes.
+CACHE_FORMAT_VERSION: Final[int] = 2
+# Caches of other shushpy releases unused for this long are deleted.
+RELEASE_MAX_AGE_SECONDS: Final[int] = 30 * 24 * 60 * 60
+_APP_NAME: Final[str] = "shushpy"
+_INDEX_DIR_NAME: Final[str] = "index"
+_TOKENIZE_DIR_NAME: Final[str] = "tokenize"
+_STRICT_DIR_NAME: Final[str] = "strict"
+_STAMP_NAME: Final[str] = ".last-used"
+_DIGEST_SIZE: Final[int] = 16
+_PERSON: Final[bytes] = (
+    f"{_APP_NAME}{sys.version_info.major}.{sys.version_info.minor}".encode("ascii")
+)
+
+
+@functools.cache
+def _release() -> str:
+    """Return the name of the versioned subdirectory holding all cache entries."""
+    try:
+        version: str = metadata.version(_APP_NAME)
+    except metadata.PackageNotFoundError:
+        version = "unknown"
+    return f"v{CACHE_FORMAT_VERSION}-{version}"
+
+
+def _cache_dir() -> Path | None:
+    """Return the cache directory for this shushpy release, or None if disabled.
+
+    Honors the `SHUSHPY_NO_CACHE` switch and the `SHUSHPY_CACHE_DIR` override.
+
+    Returns:
+        The versioned cache directory, or None if caching is disabled.
+
+    Raises:
+        RuntimeError: If the home directory cannot be determined.
+    """
+    if os.environ.get(NO_CACHE_ENV):
+        return None
+    override: str | None = os.environ.get(CACHE_DIR_ENV)
+    releases: Path
+    if override:
+        releases = Path(override)
+    else:
+        base: str | None
+        root: Path
+        if sys.platform == "win32":
+            base = os.environ.get("LOCALAPPDATA")
+            root = Path(base) if base else Path.home() / "AppData" / "Local"
+        elif sys.platform == "darwin":
+            root = Path.home() / "Library" / "Caches"
+        else:
+            base = os.environ.get("XDG_CACHE_HOME")
+            root = Path(base) if base else Path.home() / ".cache"
+        releases = root / _APP_NAME
+
+    _prune_releases(releases)
+    return releases / _release()
+
+
+@functools.cache
+def _prune_releases(releases: Path) -> None:
+    """Mark this release's cache as in use and delete long-unused ones (once per run).
+
+    Each release directory holds a stamp file touched by every process using it.
+    Directories of other releases whose stamp is older than `RELEASE_MAX_AGE_SECONDS`
+    are removed, so upgrades do not leave stale caches behind forever.
+
+    Args:
+        releases: Directory containing one subdirectory per shushpy release.
+    """
+    current: Path = releases / _release()
+    try:
+        current.mkdir(parents=True, exist_ok=True)
+        (current / _STAMP_NAME).touch()
+        cutoff: float = time.time() - RELEASE_MAX_AGE_SECONDS
+        for entry in releases.iterdir():
+            if entry == current or not entry.name.startswith("v") or not entry.is_dir():
+                continue
+            stamp: Path = entry / _STAMP_NAME
+            used: float = (stamp if stamp.exists() else entry).stat().st_mtime
+            if used < cutoff:
+                shutil.rmtree(entry, ignore_errors=True)
+    except OSError:
+        logger.debug("Could not prune cache directory %s", releases, exc_info=True)
+
+
+def _digest(data: str) -> str:
+    """Return the hex BLAKE2b digest of `data` personalized for this Python version."""
+    return hashlib.blake2b(
+        data.encode("utf-8", "surrogatepass"),
+        digest_size=_DIGEST_SIZE,
+        person=_PERSON,
+    ).hexdigest()
+
+
+def _atomic_write(target: Path, data: str) -> None:
+    """Write `data` to `target` via a temporary file and `os.replace`.
+
+    Raises:
+        OSError: For filesystem-related errors during write.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(data)
+        os.replace(tmp_name, target)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def source_key(source: str) -> str:
+    """Return the content key for a source string.
+
+    Args:
+        source: Python source code.
+
+    Returns:
+        A hex digest identifying `source` for the running Python version.
+    """
+    return _digest(source)
+
+
+def environment() -> dict[str, str]:
+    """Return the cache-related environment variables that are currently set."""
+    return {
+        name: os.environ[name]
+        for name in (CACHE_DIR_ENV, NO_CACHE_ENV)
+        if name in os.environ
+    }
+
+
+def adopt_environment(settings: dict[str, str]) -> None:
+    """Make this process's cache-related environment match `settings`.
+
+    Used as a worker-process initializer: workers started by a forkserver otherwise
+    see the environment from whenever the server was started.
+
+    Args:
+        settings: Variables as returned by `environment` in the parent process.
+    """
+    for name in (CACHE_DIR_ENV, NO_CACHE_ENV):
+        if name in settings:
+            os.environ[name] = settings[name]
+        else:
+            os.environ.pop(name, None)
+
+
+def _content_entry(key: str, strict: bool) -> Path | None:
+    """Return the content entry location for `key`, or None if caching is disabled.
+
+    Raises:
+        RuntimeError: If the home directory cannot be determined.
+    """
+    root: Path | None = _cache_dir()
+    if root is None:
+        return None
+    mode: str = _STRICT_DIR_NAME if strict else _TOKENIZE_DIR_NAME
+    return root / mode / key[:2] / key[2:]
+
+
+def load(key: str, *, strict: bool = False) -> str | None:
+    """Return the cached stripped output for `key`, or None on a miss."""
+    try:
+        entry: Path | None = _content_entry(key, strict)
+        if entry is None:
+            return None
+        with entry.open("r", encoding="utf-8", newline="") as f:
+            return f.read()
+    except (OSError, UnicodeError, RuntimeError):
+        return None
+
+
+def store(key: str, stripped: str, *, strict: bool = False) -> None:
+    """Persist the stripped output for `key`, ignoring filesystem errors."""
+    try:
+        entry: Path | None = _content_entry(key, strict)
+        if entry is not None:
+            _atomic_write(entry, stripped)
+    except (OSError, RuntimeError):
+        logger.debug("Could not write cache entry for %s", key, exc_info=True)
+
+
+def _index_entry(path: Path, encoding: str) -> Path | None:
+    """Return the index entry location for a file, or None if caching is disabled.
+
+    Raises:
+        RuntimeError: If the home directory cannot be determined.
+    """
+    root: Path | None = _cache_dir()
+    if root is None:
+        return None
+    name: str = _digest(f"{os.path.abspath(path)}\0{encoding}")
+    return root / _INDEX_DIR_NAME / name
+
+
+def _signature(stat: os.stat_result) -> list[str]:
+    """Return the fields of `stat` that must all match for an index hit."""
+    return [
+        str(stat.st_mtime_ns),
+        str(stat.st_size),
+        str(stat.st_ino),
+        str(stat.st_ctime_ns),
+    ]
+
+
+def lookup_index(path: Path, stat: os.stat_result, encoding: str) -> str | None:
+    """Return the content key recorded for `path` if its stat signature matches.
+
+    Entries recorded within the same timestamp tick as the file's last modification
+    cannot tell a later same-size rewrite apart, so they never count as a hit.
+
+    Args:
+        path: Path to the source file.
+        stat: Current `os.stat_result` of the file.
+        encoding: Encoding the file is read with.
+
+    Returns:
+        The content key of the file's source, or None if unknown or stale.
+    """
+    try:
+        entry: Path | None = _index_entry(path, encoding)
+        if entry is None:
+            return None
+        with entry.open("r", encoding="utf-8") as f:
+            recorded_ns: int = os.fstat(f.fileno()).st_mtime_ns
+            fields: list[str] = f.read().split()
+    except (OSError, UnicodeError, RuntimeError):
+        return None
+
+    if stat.st_mtime_ns >= recorded_ns:
+        return None
+    if len(fields) != 5 or fields[:4] != _signature(stat):
+        return None
+    return fields[4]
+
+
+def record_index(path: Path, stat: os.stat_result, encoding: str, key: str) -> None:
+    """Record that `path` with the given stat signature has content key `key`."""
+    try:
+        entry: Path | None = _index_entry(path, encoding)
+        if entry is not None:
+            _atomic_write(entry, " ".join([*_signature(stat), key]) + "\n")
+    except (OSError, RuntimeError):
+        logger.debug("Could not write index entry for %s", path, exc_info=True)
@@ -0,0 +1,48 @@
+"""
+Docstring removal for the strict (AST round-trip) pipeline.
+
+This module is kept free of dynamic features and fully annotated so it can be
+compiled with mypyc. Compiled wheels are opt-in (see the `mypyc` build hook in
+`pyproject.toml`); the pure-Python module is used whenever no compiled extension is
+installed, with identical behavior.
+"""
+
+from __future__ import annotations
+
+import ast
+from typing import Final
+
+# Resolved once at import; exact-type checks below skip the MRO walk of `isinstance`.
+# `ast.parse` never produces subclasses of these node types.
+_MODULE: Final = ast.Module
+_EXPR: Final = ast.Expr
+_CONSTANT: Final = ast.Constant
+
+
+def body_without_docstring(
+    node: ast.Module | ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef,
+) -> list[ast.stmt]:
+    """Return the body of a scope without its docstring.
+
+    A docstring is a leading `ast.Expr` whose value is a string `ast.Constant`. The
+    node itself is never modified. A class or function body left empty is replaced by
+    a single `pass` statement located at the removed docstring.
+
+    Args:
+        node: The module, class, or function whose body to return.
+
+    Returns:
+        The statements of `node.body`, minus a leading docstring if present.
+    """
+    body: list[ast.stmt] = node.body
+    if body:
+        first: ast.stmt = body[0]
+        if (
+            type(first) is _EXPR
+            and type(first.value) is _CONSTANT
+            and type(first.value.value) is str
+        ):
+            body = body[1:]
+            if not body and type(node) is not _MODULE:
+                body = [ast.copy_location(ast.Pass(), first)]
+    return body
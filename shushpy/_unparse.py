@@ -0,0 +1,65 @@
+"""
+Fused docstring stripping and source generation for the strict pipeline.
+
+`ast.unparse` already special-cases the leading docstring of every module, class, and
+function body while emitting code. `FusedUnparser` hooks into that spot to skip the
+docstring instead of writing it, so stripping and unparsing happen in one traversal
+and the parsed tree is never modified.
+
+Node dispatch is specialized too: `ast.NodeVisitor.visit` builds a `visit_<Name>`
+string and looks it up with `getattr` for every node, whereas `FusedUnparser` resolves
+all handlers once, at import time, into a table keyed by node class.
+
+This relies on `ast._Unparser`, the private class behind `ast.unparse`, and its
+`_write_docstring_and_traverse_body` hook. Both exist in every Python release this
+was tested with, but they are not public API and may change in a future release;
+the module is therefore only imported when strict mode is used.
+"""
+
+from __future__ import annotations
+
+import ast
+from collections.abc import Callable, Sequence
+from typing import Any, Final
+
+from shushpy._stripper import body_without_docstring
+
+
+class FusedUnparser(ast._Unparser):  # type: ignore[name-defined,misc]
+    """`ast.unparse` implementation that omits module, class, and function docstrings.
+
+    Methods:
+        traverse: Emit a node (or list of nodes) via the precomputed handler table.
+        _write_docstring_and_traverse_body: Emit a scope body without its docstring.
+    """
+
+    def traverse(self, node: ast.AST | Sequence[ast.AST]) -> None:
+        handler: Callable[[Any, Any], None] | None = _HANDLERS.get(type(node))
+        if handler is not None:
+            handler(self, node)
+        else:
+            # Lists, and any node class this table does not know about.
+            super().traverse(node)
+
+    def _write_docstring_and_traverse_body(
+        self, node: ast.Module | ast.ClassDef | ast.FunctionDef | ast.AsyncFunctionDef
+    ) -> None:
+        self.traverse(body_without_docstring(node))
+
+
+def _build_handlers() -> dict[type, Callable[[Any, Any], None]]:
+    """Map every concrete AST node class to its `FusedUnparser.visit_*` function."""
+    handlers: dict[type, Callable[[Any, Any], None]] = {}
+    pending: list[type] = [ast.AST]
+    while pending:
+        node_class: type = pending.pop()
+        pending.extend(node_class.__subclasses__())
+        handler: Callable[[Any, Any], None] | None = getattr(
+            FusedUnparser, f"visit_{node_class.__name__}", None
+        )
+        if handler is not None:
+            handlers[node_class] = handler
+    return handlers
+
+
+_HANDLERS: Final[dict[type, Callable[[Any, Any], None]]] = _build_handlers()
@@ -7,6 +7,7 @@ This CLI supports:
 - Processing one or more files or directories
 - In-place rewriting for file and directory inputs
 - Recursive directory traversal (configurable)
+- Parallel processing of multi-file inputs across worker processes
 
 Usage examples:
 - Single file to stdout:
@@ -15,19 +16,23 @@ Usage examples:
     cat file.py | python -m shushpy.cli
 - In-place, recursively on a directory:
     python -m shushpy.cli src/ --inplace
+- In-place, using all CPUs:
+    python -m shushpy.cli src/ --inplace --jobs 0
 """
 
 import argparse
+import functools
 import logging
 import sys
 from pathlib import Path
 from typing import Final
 
-from shushpy import strip_comments, strip_path, strip_paths
+from shushpy import iter_strip_paths, strip_comments, strip_path
 
 logger: logging.Logger = logging.getLogger(__name__)
 
 DEFAULT_ENCODING: Final[str] = "utf-8"
+DEFAULT_JOBS: Final[int] = 1
 EXIT_SUCCESS: Final[int] = 0
 EXIT_FAILURE: Final[int] = 1
 EXIT_USAGE: Final[int] = 2
@@ -86,6 +91,26 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_false",
         help="Disable recursion when processing directories.",
     )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="Regenerate code from the AST (normalizes formatting) instead of the default token-based pass.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Neither read nor write the on-disk cache of stripped outputs.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=(
+            "Number of worker processes for multi-file runs; 0 uses all CPUs "
+            f"(default: {DEFAULT_JOBS})."
+        ),
+    )
     parser.add_argument(
         "--log-level",
         choices=["CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"],
@@ -95,11 +120,25 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def _process_stdin(encoding: str) -> int:
+@functools.cache
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the argument parser, building it on first use only.
+
+    `parse_args` keeps no state on the parser, so one instance safely serves
+    repeated in-process `main()` calls.
+
+    Returns:
+        The shared, configured ArgumentParser.
+    """
+    return _build_parser()
+
+
+def _process_stdin(encoding: str, strict: bool) -> int:
     """Read Python code from stdin, strip comments/docstrings, write to stdout.
 
     Args:
         encoding: Text encoding (informational; stdin/stdout typically handle text streams).
+        strict: If True, regenerate code via the AST instead of the tokenizer pass.
 
     Returns:
         Process exit code.
@@ -107,7 +146,7 @@ def _process_stdin(encoding: str) -> int:
     # Note: stdin/stdout are text streams; encoding parameter is informational for symmetry.
     try:
         input_text: str = sys.stdin.read()
-        output_text: str = strip_comments(input_text)
+        output_text: str = strip_comments(input_text, strict=strict)
         written: int = sys.stdout.write(output_text)
         # Ensure flush to avoid buffering surprises in pipelines.
         sys.stdout.flush()
@@ -130,6 +169,9 @@ def _process_paths(
     inplace: bool,
     encoding: str,
     recursive: bool,
+    jobs: int,
+    strict: bool,
+    use_cache: bool,
 ) -> int:
     """Process one or more filesystem paths.
 
@@ -138,6 +180,9 @@ def _process_paths(
         inplace: If True, rewrite files in place.
         encoding: Encoding used when reading/writing files.
         recursive: Whether to traverse directories recursively.
+        jobs: Number of worker processes; 0 uses all CPUs.
+        strict: If True, regenerate code via the AST instead of the tokenizer pass.
+        use_cache: If False, neither read nor write the on-disk cache.
 
     Returns:
         Process exit code.
@@ -148,13 +193,19 @@ def _process_paths(
 
     try:
         if inplace:
-            results: dict[str, str] = strip_paths(
+            # Stream results: each file is already rewritten, so nothing is kept.
+            processed: int = 0
+            for _ in iter_strip_paths(
                 [Path(p) for p in paths],
                 inplace=True,
                 encoding=encoding,
                 recursive=recursive,
-            )
-            logger.info("Processed %d file(s) in place", len(results))
+                jobs=jobs,
+                strict=strict,
+                use_cache=use_cache,
+            ):
+                processed += 1
+            logger.info("Processed %d file(s) in place", processed)
             return EXIT_SUCCESS
 
         # Not inplace: emit to stdout only when there is exactly one output.
@@ -164,6 +215,8 @@ def _process_paths(
             inplace=False,
             encoding=encoding,
             recursive=recursive,
+            strict=strict,
+            use_cache=use_cache,
         )
         if len(single_results) != 1:
             logger.error(
@@ -205,22 +258,31 @@ def main(argv: list[str] | None = None) -> int:
     Returns:
         Process exit code.
     """
-    args: argparse.Namespace = _build_parser().parse_args(argv)
+    args: argparse.Namespace = _get_parser().parse_args(argv)
     _configure_logging(args.log_level)
 
     path_args: list[str] = list(args.paths)
     inplace: bool = bool(args.inplace)
     encoding: str = str(args.encoding)
     recursive: bool = bool(args.recursive)
+    jobs: int = int(args.jobs)
+    strict: bool = bool(args.strict)
+    use_cache: bool = not args.no_cache
 
     if not path_args:
         if inplace:
             logger.error("--inplace cannot be used when reading from stdin")
             return EXIT_USAGE
-        return _process_stdin(encoding=encoding)
+        return _process_stdin(encoding=encoding, strict=strict)
 
     return _process_paths(
-        path_args, inplace=inplace, encoding=encoding, recursive=recursive
+        path_args,
+        inplace=inplace,
+        encoding=encoding,
+        recursive=recursive,
+        jobs=jobs,
+        strict=strict,
+        use_cache=use_cache,
     )
 
 
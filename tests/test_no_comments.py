@@ -1,20 +1,50 @@
 from __future__ import annotations
 
 import ast
+import os
 import subprocess
 import sys
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Final
+from typing import Any, Final
 
 import pytest
 
-from shushpy import strip_comments, strip_file, strip_path, strip_paths
+import shushpy
+from shushpy import (
+    cli,
+    iter_strip_paths,
+    strip_comments,
+    strip_file,
+    strip_path,
+    strip_paths,
+)
+from shushpy import _cache
+from shushpy._cache import CACHE_DIR_ENV
+from shushpy._unparse import FusedUnparser
 
 EXIT_SUCCESS: Final[int] = 0
 EXIT_FAILURE: Final[int] = 1
 EXIT_USAGE: Final[int] = 2
 
 
+@pytest.fixture(autouse=True)
+def _isolated_cache(
+    tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Point the on-disk cache at a per-test directory (inherited by subprocesses)."""
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path_factory.mktemp("cache")))
+
+
+def _backdate(path: Path) -> None:
+    """Move a file's mtime into the past so its index entries are not racily clean."""
+    past: float = time.time() - 60
+    os.utime(path, (past, past))
+
+
 def _write_text(path: Path, data: str, *, encoding: str = "utf-8") -> None:
     """Write text to a file using a context manager."""
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -104,6 +134,198 @@ def test_strip_comments_preserves_string_literals_that_look_like_comments() -> N
     _ = _parse(result)
 
 
+def test_strip_comments_preserves_formatting_and_keeps_bodies_valid() -> None:
+    """The default token pass keeps layout and replaces emptied bodies with `pass`."""
+    source: str = (
+        "#!/usr/bin/env python\n"
+        '"""Module docstring."""\n'
+        "x = {'a':1,  'b':2}  # spacing kept\n"
+        "def only_doc():\n"
+        "    '''Only a docstring.'''\n"
+        'def inline(): "Inline docstring."\n'
+        "class K:\n"
+        '    """Class doc."""; y = 1\n'
+        "def data():\n"
+        '    b"bytes are not docstrings"\n'
+        "    return 1\n"
+    )
+    expected: str = (
+        "x = {'a':1,  'b':2}\n"
+        "def only_doc():\n"
+        "    pass\n"
+        "def inline(): pass\n"
+        "class K:\n"
+        "    pass; y = 1\n"
+        "def data():\n"
+        '    b"bytes are not docstrings"\n'
+        "    return 1\n"
+    )
+    assert strip_comments(source) == expected
+
+
+def test_strip_comments_removes_parenthesized_docstrings() -> None:
+    """Parenthesized docstrings are docstrings too; other literal statements stay."""
+    source: str = (
+        '("a"\n "b")\n'
+        "def f():\n"
+        '    ("doc")  # c\n'
+        "    return 1\n"
+        "class C:\n"
+        '    (  # opening\n        "only"\n    )\n'
+        'def g(): ("d"); return ("kept").strip()\n'
+    )
+    expected: str = (
+        "def f():\n"
+        "    return 1\n"
+        "class C:\n"
+        "    pass\n"
+        'def g(): pass; return ("kept").strip()\n'
+    )
+    assert strip_comments(source) == expected
+    assert strip_comments('("not", "doc")\n') == '("not", "doc")\n'
+
+
+def test_strip_comments_drops_module_docstring_sharing_a_line() -> None:
+    """A module docstring before `;` goes with the `;` so `__future__` still compiles."""
+    source: str = '"""d"""; from __future__ import annotations\nX: int = 1  # c\n'
+    stripped: str = strip_comments(source)
+    assert stripped == "from __future__ import annotations\nX: int = 1\n"
+    _ = compile(stripped, "<stripped>", "exec")
+    assert strip_comments('("d" ) ;  # c\nY = 2\n') == "Y = 2\n"
+
+
+def test_strip_comments_strict_regenerates_from_ast() -> None:
+    """Strict mode should normalize formatting through `ast.unparse`."""
+    source: str = "\"\"\"Doc.\"\"\"\nx = {'a':1,  'b':2}  # comment\n"
+    assert strip_comments(source, strict=True) == "x = {'a': 1, 'b': 2}\n"
+    assert strip_comments(source) == "x = {'a':1,  'b':2}\n"
+
+
+def test_fused_unparser_skips_docstrings_without_mutating_tree() -> None:
+    """Strict mode strips docstrings while unparsing, leaving the parsed tree intact."""
+    source: str = (
+        '"""Module doc."""\n'
+        "class A:\n"
+        '    """Only a docstring."""\n'
+        "async def f():\n"
+        '    """Doc."""\n'
+        "    return 1\n"
+    )
+    tree: ast.Module = _parse(source)
+    before: str = ast.dump(tree, include_attributes=True)
+
+    result: str = FusedUnparser().visit(tree)
+
+    assert result == "class A:\n    pass\n\nasync def f():\n    return 1"
+    assert ast.dump(tree, include_attributes=True) == before
+
+
+def test_fused_unparser_matches_ast_unparse_without_docstrings() -> None:
+    """Table-driven dispatch must emit exactly what `ast.unparse` emits."""
+    source: str = (
+        "import os as o\n"
+        "@dec(1)\n"
+        "async def f[T](a: int, /, *args: T, b=lambda x: x ** 2, **kw) -> list[T]:\n"
+        "    async with ctx() as c, other():\n"
+        "        yield [i async for i in c if i % 2]\n"
+        "    match kw:\n"
+        "        case {'k': [1, *rest]} | None:\n"
+        "            return f'{o.sep!r:>{width}}'\n"
+        "try:\n"
+        "    x = (y := 3) if not z else {**d, 'e': {1, 2}}\n"
+        "except* (ValueError, TypeError) as eg:\n"
+        "    del x[1:2, ::3]\n"
+        "type Alias[K] = dict[K, 'V']\n"
+    )
+    tree: ast.Module = _parse(source)
+    assert FusedUnparser().visit(tree) == ast.unparse(tree)
+
+
+def test_strip_comments_strict_strips_nested_scopes() -> None:
+    """Strict mode should reach scopes nested in compound statements."""
+    source: str = (
+        "if True:\n"
+        "    class A:\n"
+        '        """Doc A."""\n'
+        "        try:\n"
+        "            def f():\n"
+        '                """Doc f."""\n'
+        "        except ValueError:\n"
+        "            pass\n"
+    )
+    expected: str = (
+        "if True:\n"
+        "\n"
+        "    class A:\n"
+        "        try:\n"
+        "\n"
+        "            def f():\n"
+        "                pass\n"
+        "        except ValueError:\n"
+        "            pass\n"
+    )
+    assert strip_comments(source, strict=True) == expected
+
+
+def test_strip_comments_returns_plain_source_untouched() -> None:
+    """Source without comments or string literals is returned as the same object."""
+    source: str = "from os import path\nPLAIN_VALUE = path.sep\n"
+    assert strip_comments(source) is source
+    assert strip_comments("PLAIN_NO_NEWLINE = 1") == "PLAIN_NO_NEWLINE = 1\n"
+    with pytest.raises(SyntaxError):
+        _ = strip_comments("def f(:\n    pass\n")
+
+
+@pytest.mark.parametrize("eol", ["\n", "\r\n", "\r"])
+def test_strip_comments_token_pass_handles_every_line_ending(eol: str) -> None:
+    """LF, CRLF, and CR-only sources are split into lines the way the parser does."""
+    source: str = eol.join(
+        [
+            'x = "a"  # c',
+            "# own line",
+            "y = 2",
+            "def f():",
+            '    "doc"',
+            "    return 1",
+            "",
+        ]
+    )
+    expected: str = eol.join(['x = "a"', "y = 2", "def f():", "    return 1", ""])
+    assert strip_comments(source) == expected
+
+
+@pytest.mark.parametrize("eol", ["\n", "\r\n", "\r"])
+def test_ascii_scanner_matches_token_pass_for_every_line_ending(eol: str) -> None:
+    """The byte scanner ends comments at any line break, exactly like the token pass."""
+    source: str = eol.join(["x = 1  # c", "    # own line", "y = 2 #", "z = 3", ""])
+    expected: str = eol.join(["x = 1", "y = 2", "z = 3", ""])
+    scanned: bytes | None = shushpy._strip_ascii_comments(source.encode("ascii"))
+    assert scanned == expected.encode("ascii")
+    assert strip_comments(source) == expected
+    # A trailing string literal forces the token pass for the same comment layout.
+    assert strip_comments(source + "s = 'q'" + eol) == expected + "s = 'q'" + eol
+
+
+def test_strip_comments_without_string_literals_keeps_line_endings() -> None:
+    """Comment-only edits (quotes inside comments included) keep CRLF line endings."""
+    source: str = "import os  # don't tokenize\r\n    # it's\r\nSCANNED = os.sep\r\n"
+    assert strip_comments(source) == "import os\r\nSCANNED = os.sep\r\n"
+
+
+def test_strip_comments_without_comments_or_docstrings_returns_source() -> None:
+    """String literals that are not docstrings leave the source as written."""
+    source: str = "__all__ = [ 'a',\n    \"b\" ]\ndef f():\n    return ('x')\n"
+    assert strip_comments(source) == source
+    assert strip_comments("X = 'y'\nclass C:\n    'doc'\n") == "X = 'y'\nclass C:\n    pass\n"
+
+
+def test_strip_comments_memoizes_identical_sources() -> None:
+    """Repeated identical sources should be served from the in-process memo."""
+    source: str = '"""Doc"""\nMEMO: int = 1  # inline\n'
+    first: str = strip_comments(source)
+    assert strip_comments(source) is first
+
+
 def test_strip_file_inplace_and_no_inplace(tmp_path: Path) -> None:
     """Verify strip_file returns transformed content and optionally writes in-place."""
     original: str = (
@@ -173,6 +395,68 @@ def test_strip_path_directory_inplace_and_no_inplace(tmp_path: Path) -> None:
     assert "#" not in _read_text(p2)
 
 
+def test_strip_path_parallel_matches_serial(tmp_path: Path) -> None:
+    """Parallel stripping should produce the serial results and surface syntax errors."""
+    src_dir: Path = tmp_path / "src"
+    for index in range(4):
+        _write_text(
+            src_dir / f"m{index}.py",
+            f'"""Doc {index}"""\n# c\nVALUE_{index}: int = {index}  # inline\n',
+        )
+
+    serial: dict[str, str] = strip_path(src_dir, inplace=False, jobs=1)
+    parallel: dict[str, str] = strip_path(src_dir, inplace=False, jobs=2)
+    assert parallel == serial
+
+    _write_text(src_dir / "bad.py", "def f(:\n    pass\n")
+    with pytest.raises(SyntaxError):
+        _ = strip_path(src_dir, inplace=False, jobs=2)
+
+
+def test_strip_paths_parallel_uses_one_pool_for_all_paths(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Files from every path argument are shared out by a single worker pool."""
+    pools: list[int | None] = []
+
+    class _CountingPool(ProcessPoolExecutor):
+        def __init__(self, max_workers: int | None = None, **kwargs: Any) -> None:
+            pools.append(max_workers)
+            super().__init__(max_workers, **kwargs)
+
+    monkeypatch.setattr(shushpy, "ProcessPoolExecutor", _CountingPool)
+    files: list[str | Path] = []
+    for index in range(3):
+        files.append(tmp_path / f"p{index}.py")
+        _write_text(tmp_path / f"p{index}.py", f"POOLED_{index}: int = {index}  # c\n")
+
+    parallel: dict[str, str] = strip_paths(files, jobs=2)
+    assert pools == [2]
+    assert parallel == strip_paths(files, jobs=1)
+    assert list(parallel) == [str(f) for f in files]
+
+
+def test_strip_path_serial_prefetch_keeps_order_and_errors(tmp_path: Path) -> None:
+    """Reads done ahead on threads must not reorder results or swallow errors."""
+    src_dir: Path = tmp_path / "src"
+    for index in range(12):
+        _write_text(src_dir / f"m{index:02d}.py", f"VALUE_{index}: int = {index}  # c\n")
+
+    results: dict[str, str] = strip_path(src_dir, inplace=False)
+    assert list(results) == [
+        str(p) for p in shushpy._iter_python_files(src_dir, recursive=True)
+    ]
+    assert results[str(src_dir / "m07.py")] == "VALUE_7: int = 7\n"
+
+    (src_dir / "m05.py").write_bytes(b"NAME = '\xff'\n")
+    threads_before: int = threading.active_count()
+    with pytest.raises(UnicodeDecodeError) as excinfo:
+        _ = strip_path(src_dir, inplace=False)
+    # The reader threads are gone even while the traceback is still referenced.
+    assert excinfo.value is not None
+    assert threading.active_count() == threads_before
+
+
 def test_strip_paths_mixed_inputs(tmp_path: Path) -> None:
     """Verify strip_paths handles a mix of file and directory inputs."""
     d: Path = tmp_path / "pkg"
@@ -191,6 +475,23 @@ def test_strip_paths_mixed_inputs(tmp_path: Path) -> None:
     assert '"""' not in results[str(p_single)]
 
 
+def test_iter_strip_paths_streams_results(tmp_path: Path) -> None:
+    """iter_strip_paths should lazily yield the same pairs strip_paths returns."""
+    d: Path = tmp_path / "pkg"
+    _write_text(d / "a.py", '"""Doc"""\nA: int = 1  # inline\n')
+    _write_text(d / "b.py", '"""Doc"""\nB: int = 2  # inline\n')
+    bogus: Path = tmp_path / "missing.py"
+
+    stream: Iterator[tuple[str, str]] = iter_strip_paths([d, bogus])
+    first: tuple[str, str] = next(stream)
+    assert first[0] in {str(d / "a.py"), str(d / "b.py")}
+    _ = next(stream)
+    with pytest.raises(FileNotFoundError):
+        _ = next(stream)
+
+    assert dict(iter_strip_paths([d])) == strip_paths([d])
+
+
 def test_cli_stdin_to_stdout_roundtrip() -> None:
     """CLI should read from stdin and write stripped result to stdout."""
     source: str = '"""Doc"""\ndef f() -> int:\n    # inline comment\n    return 42\n'
@@ -225,6 +526,20 @@ def test_cli_single_file_to_stdout(tmp_path: Path) -> None:
     assert proc.stderr == ""
 
 
+def test_cli_main_reuses_parser_across_calls(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Repeated in-process `main()` calls share one parser without leaking options."""
+    p: Path = tmp_path / "one.py"
+    _write_text(p, '"""Doc"""\nvalue: int = 5  # comment\n')
+
+    assert cli.main([str(p), "--strict"]) == EXIT_SUCCESS
+    assert capsys.readouterr().out == strip_comments(_read_text(p), strict=True)
+    assert cli.main([str(p)]) == EXIT_SUCCESS
+    assert capsys.readouterr().out == strip_comments(_read_text(p))
+    assert cli._get_parser() is cli._get_parser()
+
+
 def test_cli_directory_inplace(tmp_path: Path) -> None:
     """CLI should modify files in place when --inplace is provided for a directory."""
     d: Path = tmp_path / "pkg"
@@ -355,3 +670,147 @@ def test_strip_path_skips_python_packages_submodules(tmp_path: Path) -> None:
     # Should only include top-level file, skip package contents
     assert set(results.keys()) == {str(top_file)}
     assert '"""' not in results[str(top_file)] and "#" not in results[str(top_file)]
+
+
+def test_strip_file_unchanged_file_is_served_from_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A second strip of an unchanged file should not read it again."""
+    p: Path = tmp_path / "cached.py"
+    _write_text(p, '"""Doc"""\nCACHED: int = 1  # inline\n')
+    _backdate(p)
+    first: str = strip_file(p)
+
+    def _fail_read(path: Path, encoding: str) -> str:
+        raise AssertionError(f"unexpected read of {path}")
+
+    monkeypatch.setattr(shushpy, "_read_text", _fail_read)
+    assert strip_file(p) == first
+
+    # Modifying the file invalidates the index entry and forces a fresh read.
+    _write_text(p, '"""Doc"""\nCHANGED_VALUE: int = 2  # inline\n')
+    with pytest.raises(AssertionError, match="unexpected read"):
+        _ = strip_file(p)
+
+
+def test_strip_file_index_rejects_same_size_rewrites(tmp_path: Path) -> None:
+    """A rewrite keeping size and mtime (`cp -p`, coarse clocks) is not served stale."""
+    p: Path = tmp_path / "same.py"
+    _write_text(p, "A = 1  # one\n")
+    _backdate(p)
+    assert strip_file(p) == "A = 1\n"
+
+    mtime_ns: int = p.stat().st_mtime_ns
+    _write_text(p, "B = 2  # two\n")
+    os.utime(p, ns=(mtime_ns, mtime_ns))
+    assert strip_file(p, inplace=True) == "B = 2\n"
+    assert _read_text(p) == "B = 2\n"
+
+    # An entry recorded no later than the file's mtime is racily clean and ignored.
+    future_ns: int = time.time_ns() + 10**12
+    _write_text(p, "C = 3  # three\n")
+    os.utime(p, ns=(future_ns, future_ns))
+    assert strip_file(p) == "C = 3\n"
+    _write_text(p, "D = 4  # four!\n")
+    os.utime(p, ns=(future_ns, future_ns))
+    assert strip_file(p) == "D = 4\n"
+
+
+def test_cache_is_versioned_and_can_be_disabled(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Entries live under a per-release directory; the opt-out writes nothing."""
+    cache: Path = tmp_path / "cache"
+    monkeypatch.setenv(CACHE_DIR_ENV, str(cache))
+    stale: Path = cache / "v1-0.0.0"
+    recent: Path = cache / "v1-0.0.1"
+    for old_release in (stale, recent):
+        (old_release / "index").mkdir(parents=True)
+    long_ago: float = time.time() - _cache.RELEASE_MAX_AGE_SECONDS - 60
+    os.utime(stale, (long_ago, long_ago))
+
+    versioned: Path = tmp_path / "versioned.py"
+    _write_text(versioned, '"""Doc"""\nVERSIONED: int = 1  # inline\n')
+    _ = strip_file(versioned)
+    assert sorted(p.name for p in cache.iterdir()) == sorted(
+        [_cache._release(), recent.name]
+    )
+    assert _cache._release().startswith(f"v{_cache.CACHE_FORMAT_VERSION}-")
+
+    # Ad-hoc strings are memoized in-process only and never reach the disk cache.
+    release: Path = cache / _cache._release()
+    on_disk: int = sum(1 for p in release.rglob("*") if p.is_file())
+    _ = strip_comments('"""Doc"""\nAD_HOC: int = 1  # inline\n')
+    assert sum(1 for p in release.rglob("*") if p.is_file()) == on_disk
+
+    disabled: Path = tmp_path / "disabled"
+    monkeypatch.setenv(CACHE_DIR_ENV, str(disabled))
+    monkeypatch.setenv(_cache.NO_CACHE_ENV, "1")
+    p: Path = tmp_path / "nocache.py"
+    _write_text(p, '"""Doc"""\nNO_CACHE: int = 1  # inline\n')
+    assert strip_file(p) == "NO_CACHE: int = 1\n"
+    assert not disabled.exists()
+
+    assert strip_file(p, use_cache=False) == "NO_CACHE: int = 1\n"
+
+
+def test_cache_opt_out_reaches_worker_processes(tmp_path: Path) -> None:
+    """`use_cache=False` holds in parallel runs, before and after cached ones."""
+    cache: Path = Path(os.environ[CACHE_DIR_ENV])
+    src_dir: Path = tmp_path / "src"
+    for index in range(4):
+        _write_text(src_dir / f"w{index}.py", f"WORKER_{index}: int = {index}  # c\n")
+
+    def _entries() -> int:
+        return sum(1 for p in cache.rglob("*") if p.is_file())
+
+    _ = strip_path(src_dir, jobs=2)
+    cached_entries: int = _entries()
+    assert cached_entries > 0
+
+    for index in range(4):
+        _write_text(src_dir / f"w{index}.py", f"FRESH_{index}: int = {index}  # c\n")
+    assert cli.main(["--no-cache", "-j", "2", "--inplace", str(src_dir)]) == 0
+    assert _entries() == cached_entries
+    assert _read_text(src_dir / "w1.py") == "FRESH_1: int = 1\n"
+
+    _write_text(src_dir / "w0.py", "LATER: int = 0  # c\n")
+    _ = strip_path(src_dir, jobs=2)
+    assert _entries() > cached_entries
+
+
+def test_cache_without_home_directory_is_skipped(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """An unresolvable home directory disables the cache instead of failing."""
+
+    def _no_home() -> Path:
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.delenv(CACHE_DIR_ENV)
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr(Path, "home", staticmethod(_no_home))
+    assert strip_comments('"""d"""\nHOMELESS = 1  # c\n') == "HOMELESS = 1\n"
+
+
+def test_strip_file_inplace_skips_rewriting_stripped_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Repeated in-place runs should neither rewrite nor, eventually, re-read a file."""
+    p: Path = tmp_path / "twice.py"
+    _write_text(p, '"""Doc"""\nTWICE: int = 1  # inline\n')
+    stripped: str = strip_file(p, inplace=True)
+    _backdate(p)
+
+    def _fail_write(path: Path, data: str, encoding: str) -> None:
+        raise AssertionError(f"unexpected write of {path}")
+
+    monkeypatch.setattr(shushpy, "_write_text", _fail_write)
+    assert strip_file(p, inplace=True) == stripped
+
+    def _fail_read(path: Path, encoding: str) -> str:
+        raise AssertionError(f"unexpected read of {path}")
+
+    monkeypatch.setattr(shushpy, "_read_text", _fail_read)
+    assert strip_file(p, inplace=True) == stripped
+    assert _read_text(p) == stripped